@@ -3,7 +3,6 @@ This module contains methods that can be used in various plot modules and don't
 """
 
 import numpy as np
-import scikitplot as skplt
 
 
 def leverage_statistic(x: np.ndarray):
@@ -27,8 +26,9 @@ def leverage_statistic(x: np.ndarray):
         x = x.reshape(x.shape[0], 1)
 
     cov_mat_inv = np.linalg.inv(x.T.dot(x))
-    H = x.dot(cov_mat_inv.dot(x.T))
-    leverage = H.diagonal()
+    # only the diagonal of the n x n hat matrix is needed, so compute
+    # h_i = x_i^T (X^T X)^{-1} x_i row-wise instead of materializing H
+    leverage = np.einsum("ij,ij->i", x.dot(cov_mat_inv), x)
     return leverage
 
 
@@ -70,9 +70,8 @@ def calculate_standardized_residual(
     if m is None:
         m = 1
     s2_hat = 1 / (n - m) * np.sum(residuals ** 2)
-    leverage = 1 / n + (expected - np.mean(expected)) / np.sum(
-        (expected - np.mean(expected)) ** 2
-    )
+    centered_expected = expected - np.mean(expected)
+    leverage = 1 / n + centered_expected / np.sum(centered_expected ** 2)
     standardized_residuals = residuals / (np.sqrt(s2_hat) * (1 - leverage))
     return standardized_residuals
 
@@ -110,13 +109,17 @@ def cooks_distance(
 
     """
     p = n_model_params if n_model_params is not None and n_model_params >= 1 else 1
-    multiplier = [element / (1 - element) for element in leverage_statistic]
+    leverage_statistic = np.asarray(leverage_statistic)
+    multiplier = leverage_statistic / (1 - leverage_statistic)
     distance = np.multiply(np.power(standardized_residuals, 2) / (p + 1), multiplier)
     return distance
 
 
 class MatplotlibDefaultDPI(object):
     def __init__(self, base_dpi: float = 100, scale_to_set: float = 1):
+        import scikitplot as skplt
+
+        self._skplt = skplt
         try:
             self.default_skplt_dpit = skplt.metrics.plt.rcParams["figure.dpi"]
             skplt.metrics.plt.rcParams["figure.dpi"] = base_dpi * scale_to_set
@@ -128,6 +131,6 @@ class MatplotlibDefaultDPI(object):
 
     def __exit__(self, type, value, traceback):
         try:
-            skplt.metrics.plt.rcParams["figure.dpi"] = self.default_skplt_dpit
+            self._skplt.metrics.plt.rcParams["figure.dpi"] = self.default_skplt_dpit
         except:
             pass
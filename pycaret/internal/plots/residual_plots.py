@@ -2,7 +2,6 @@ from typing import Any, Dict, Optional, Union, Sequence
 
 from scipy import stats
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.basewidget import BaseFigureWidget
 import pandas as pd
 import numpy as np
@@ -14,6 +13,62 @@ from pycaret.internal.Display import Display
 from pycaret.internal.logging import get_logger
 from pycaret.internal.validation import fit_if_not_fitted
 
+# same modes and threshold plotly.express uses for render_mode="auto"
+RENDER_MODES = ("auto", "svg", "webgl")
+WEBGL_MIN_POINTS = 1000
+
+# style of the arrows pointing at the most extreme observations
+ANNOTATION_STYLE = dict(xref="x", yref="y", showarrow=True, arrowhead=7, ax=0, ay=-40)
+
+
+def _check_render_mode(render_mode: str):
+    if render_mode not in RENDER_MODES:
+        raise ValueError(
+            f"render_mode must be one of {RENDER_MODES}, got {render_mode!r} instead."
+        )
+
+
+def _check_max_points(max_points: Optional[int]):
+    # the smallest and the largest quantile are always kept, so at least two points are needed
+    if max_points is not None and max_points < 2:
+        raise ValueError(f"max_points must be None or at least 2, got {max_points}.")
+
+
+def _lowess_scatter(
+    x_label: str,
+    x: np.ndarray,
+    y_label: str,
+    y: np.ndarray,
+    title: str,
+    split_origin: np.ndarray = None,
+    render_mode: str = "auto",
+) -> go.Figure:
+    """
+    Scatter plot of y versus x including a lowess trend line, as shared by the residual widgets.
+    If split_origin is given, train and test observations are coloured and fitted separately.
+    """
+    import plotly.express as px
+
+    data = {x_label: x, y_label: y}
+    color_kwargs = {}
+    if split_origin is not None:
+        data["Split"] = split_origin
+        color_kwargs = dict(color="Split", color_discrete_sequence=["blue", "green"])
+
+    fig = px.scatter(
+        pd.DataFrame(data),
+        x=x_label,
+        y=y_label,
+        trendline="lowess",
+        title=title,
+        opacity=0.3,
+        render_mode=render_mode,
+        **color_kwargs,
+    )
+    if split_origin is not None:
+        fig.update_layout(showlegend=False)
+    return fig
+
 
 class QQPlotWidget(BaseFigureWidget):
     """
@@ -29,6 +84,8 @@ class QQPlotWidget(BaseFigureWidget):
         expected: np.ndarray = None,
         featuresize: int = None,
         split_origin: np.array = None,
+        render_mode: str = "auto",
+        max_points: Optional[int] = 5000,
         **kwargs,
     ):
         """
@@ -48,6 +105,13 @@ class QQPlotWidget(BaseFigureWidget):
             These residuals can be marked explicitly in the plot. This attribute must have the same dimensionality
             as the predictions and expected array. Each entry in this array must be one of the strings ['train', 'test']
             to denote from which split this observation originates.
+        render_mode: str
+            One of ['auto', 'svg', 'webgl']. With 'auto', WebGL is used once the plot contains more than
+            WEBGL_MIN_POINTS points, 'svg' can be used to force vector output.
+        max_points: int
+            Optional, the maximum number of quantiles drawn. Larger samples are thinned to evenly spaced order
+            statistics, always keeping the smallest and largest one, so it must be at least 2.
+            If None, all quantiles are drawn.
         """
 
         if expected is not None:
@@ -56,7 +120,11 @@ class QQPlotWidget(BaseFigureWidget):
             )
         else:
             std_res = predicted
-        self._plot = self.__qq_plot(std_res, split_origin)
+        _check_render_mode(render_mode)
+        _check_max_points(max_points)
+        self._render_mode = render_mode
+        self._max_points = max_points
+        self._plot = self.__qq_plot(std_res, split_origin, render_mode, max_points)
         super(QQPlotWidget, self).__init__(self._plot, **kwargs)
 
     @staticmethod
@@ -84,29 +152,43 @@ class QQPlotWidget(BaseFigureWidget):
         return qq[0], qq[1][:2]
 
     def __qq_plot(
-        self, standardized_residuals: np.ndarray, split_origin: np.array = None
+        self,
+        standardized_residuals: np.ndarray,
+        split_origin: np.array = None,
+        render_mode: str = "auto",
+        max_points: Optional[int] = None,
     ) -> go.Figure:
         (osm, osr), (slope, intercept) = self.__get_qq(
             standardized_residuals=standardized_residuals
         )
-        fig = go.Figure()
-
         if split_origin is not None:
             # calculate the sorted split origin list w.r.t to the standardized residuals
             # with this list we know which (theoretical quantile | empirical quantile) point belongs to which origin
-            sorted_split_origin = np.array(
-                [
-                    origin
-                    for (_, origin) in sorted(
-                        enumerate(split_origin),
-                        key=lambda idx_value: standardized_residuals[idx_value[0]],
-                    )
-                ]
+            sorted_split_origin = np.asarray(split_origin)[
+                np.argsort(standardized_residuals, kind="stable")
+            ]
+
+        if max_points is not None and osm.shape[0] > max_points:
+            # thin out the order statistics evenly, the first and the last quantile are always kept
+            keep = np.unique(
+                np.linspace(0, osm.shape[0] - 1, max_points).round().astype(int)
             )
+            osm = osm[keep]
+            osr = osr[keep]
+            if split_origin is not None:
+                sorted_split_origin = sorted_split_origin[keep]
+
+        if render_mode == "webgl" or (
+            render_mode == "auto" and osm.shape[0] > WEBGL_MIN_POINTS
+        ):
+            scatter = go.Scattergl
+        else:
+            scatter = go.Scatter
+        if split_origin is not None:
             colors = sorted_split_origin.copy()
             colors[sorted_split_origin == "train"] = "blue"
             colors[sorted_split_origin == "test"] = "green"
-            fig.add_scatter(
+            quantiles = scatter(
                 x=osm,
                 y=osr,
                 mode="markers",
@@ -117,10 +199,13 @@ class QQPlotWidget(BaseFigureWidget):
                 opacity=0.7,
             )
         else:
-            fig.add_scatter(x=osm, y=osr, mode="markers", name="quantiles", opacity=0.7)
+            quantiles = scatter(
+                x=osm, y=osr, mode="markers", name="quantiles", opacity=0.7
+            )
 
         x = np.array([osm[0], osm[-1]])
-        fig.add_scatter(x=x, y=intercept + slope * x, mode="lines", name="OLS")
+        ols = go.Scatter(x=x, y=intercept + slope * x, mode="lines", name="OLS")
+        fig = go.Figure(data=[quantiles, ols])
         fig.layout.update(
             autosize=True,
             showlegend=False,
@@ -160,9 +245,13 @@ class QQPlotWidget(BaseFigureWidget):
                 predicted, expected, featuresize
             ),
             split_origin=split_origin,
+            render_mode=self._render_mode,
+            max_points=self._max_points,
         )
-        self.update({"data": self._plot.data}, overwrite=True)
-        self.update_layout()
+        with self.batch_update():
+            self.update(
+                {"data": self._plot.data, "layout": self._plot.layout}, overwrite=True
+            )
 
 
 class ScaleLocationWidget(BaseFigureWidget):
@@ -178,6 +267,7 @@ class ScaleLocationWidget(BaseFigureWidget):
         predictions: np.ndarray,
         sqrt_abs_standardized_residuals: np.ndarray,
         split_origin: np.ndarray = None,
+        render_mode: str = "auto",
         **kwargs,
     ):
         """
@@ -194,62 +284,43 @@ class ScaleLocationWidget(BaseFigureWidget):
             These residuals can be marked explicitly in the plot. This attribute must have the same dimensionality
             as the predictions and sqrt_abs_standardized_residuals array. Each entry in this array must be one of the strings ['train', 'test']
             to denote from which split this observation originates.
+        render_mode: str
+            One of ['auto', 'svg', 'webgl']. With 'auto', WebGL is used once the plot contains more than
+            WEBGL_MIN_POINTS points, 'svg' can be used to force vector output.
         """
+        _check_render_mode(render_mode)
+        self._render_mode = render_mode
         self._plot = self.__scale_location_plot(
-            predictions, sqrt_abs_standardized_residuals, split_origin
+            predictions, sqrt_abs_standardized_residuals, split_origin, render_mode
         )
         super(ScaleLocationWidget, self).__init__(self._plot, **kwargs)
 
     @staticmethod
-    def __scale_location_plot(fitted, sqrt_abs_standardized_residuals, split_origin):
+    def __scale_location_plot(
+        fitted, sqrt_abs_standardized_residuals, split_origin, render_mode="auto"
+    ):
         sqrt_abs_standardized_residuals = pd.Series(sqrt_abs_standardized_residuals)
+        fig = _lowess_scatter(
+            "Predictions",
+            fitted,
+            "$\sqrt{|Standardized Residuals|}$",
+            sqrt_abs_standardized_residuals,
+            title="Scale-Location Plot",
+            split_origin=split_origin,
+            render_mode=render_mode,
+        )
 
-        if split_origin is not None:
-            dataframe = pd.DataFrame(
-                {
-                    "Predictions": fitted,
-                    "Split": split_origin,
-                    "$\sqrt{|Standardized Residuals|}$": sqrt_abs_standardized_residuals,
-                }
-            )
-            fig = px.scatter(
-                dataframe,
-                x="Predictions",
-                y="$\sqrt{|Standardized Residuals|}$",
-                trendline="lowess",
-                color="Split",
-                color_discrete_sequence=["blue", "green"],
-                title="Scale-Location Plot",
-                opacity=0.3,
-            )
-
-            fig.update_layout(showlegend=False)
-        else:
-            dataframe = pd.DataFrame(
-                {
-                    "Predictions": fitted,
-                    "$\sqrt{|Standardized Residuals|}$": sqrt_abs_standardized_residuals,
-                }
-            )
-            fig = px.scatter(
-                dataframe,
-                x="Predictions",
-                y="$\sqrt{|Standardized Residuals|}$",
-                trendline="lowess",
-                title="Scale-Location Plot",
-                opacity=0.3,
-            )
-
-        abs_sq_norm_resid = sqrt_abs_standardized_residuals.sort_values(ascending=False)
-        abs_sq_norm_resid_top_3 = abs_sq_norm_resid[:3]
-        for i in abs_sq_norm_resid_top_3.index:
-            fig.add_annotation(
-                x=fitted[i],
-                y=sqrt_abs_standardized_residuals[i],
-                text=f"$\sqrt{{|\\tilde r_{{{i}}}|}}$",
-            )
-        fig.update_annotations(
-            dict(xref="x", yref="y", showarrow=True, arrowhead=7, ax=0, ay=-40)
+        abs_sq_norm_resid_top_3 = sqrt_abs_standardized_residuals.nlargest(3)
+        fig.update_layout(
+            annotations=[
+                dict(
+                    x=fitted[i],
+                    y=sqrt_abs_standardized_residuals[i],
+                    text=f"$\sqrt{{|\\tilde r_{{{i}}}|}}$",
+                    **ANNOTATION_STYLE,
+                )
+                for i in abs_sq_norm_resid_top_3.index
+            ]
         )
         return fig
 
@@ -275,10 +346,12 @@ class ScaleLocationWidget(BaseFigureWidget):
             to denote from which split this observation originates.
         """
         self._plot = self.__scale_location_plot(
-            predicted, sqrt_abs_standardized_residuals, split_origin
+            predicted, sqrt_abs_standardized_residuals, split_origin, self._render_mode
         )
-        self.update({"data": self._plot.data}, overwrite=True)
-        self.update_layout()
+        with self.batch_update():
+            self.update(
+                {"data": self._plot.data, "layout": self._plot.layout}, overwrite=True
+            )
 
 
 class CooksDistanceWidget(BaseFigureWidget):
@@ -298,6 +371,7 @@ class CooksDistanceWidget(BaseFigureWidget):
         standardized_residuals: np.ndarray,
         n_model_params: int,
         split_origin: np.ndarray = None,
+        render_mode: str = "auto",
         **kwargs,
     ):
         """
@@ -318,13 +392,19 @@ class CooksDistanceWidget(BaseFigureWidget):
             These residuals can be marked explicitly in the plot. This attribute must have the same dimensionality
             as the model_leverage and standardized_residuals array. Each entry in this array must be one of the
             strings ['train', 'test'] to denote from which split this observation originates.
+        render_mode: str
+            One of ['auto', 'svg', 'webgl']. With 'auto', WebGL is used once the plot contains more than
+            WEBGL_MIN_POINTS points, 'svg' can be used to force vector output.
         """
+        _check_render_mode(render_mode)
+        self._render_mode = render_mode
         self._plot = self.__cooks_distance_plot(
             model_leverage,
             cooks_distances,
             standardized_residuals,
             n_model_params,
             split_origin,
+            render_mode,
         )
         super(CooksDistanceWidget, self).__init__(self._plot, **kwargs)
 
@@ -335,60 +415,36 @@ class CooksDistanceWidget(BaseFigureWidget):
         standardized_residuals,
         n_model_params,
         split_origin,
+        render_mode="auto",
     ):
         cooks_distances = pd.Series(cooks_distances)
+        fig = _lowess_scatter(
+            "Leverage",
+            model_leverage,
+            "Standardized Residuals",
+            standardized_residuals,
+            title="Residuals vs Leverage",
+            split_origin=split_origin,
+            render_mode=render_mode,
+        )
 
-        if split_origin is not None:
-            dataframe = pd.DataFrame(
-                {
-                    "Leverage": model_leverage,
-                    "Standardized Residuals": standardized_residuals,
-                    "Split": split_origin,
-                }
-            )
-            fig = px.scatter(
-                dataframe,
-                x="Leverage",
-                y="Standardized Residuals",
-                trendline="lowess",
-                color="Split",
-                color_discrete_sequence=["blue", "green"],
-                title="Residuals vs Leverage",
-                opacity=0.3,
-            )
-
-            fig.update_layout(showlegend=False)
-        else:
-            dataframe = pd.DataFrame(
-                {
-                    "Leverage": model_leverage,
-                    "Standardized Residuals": standardized_residuals,
-                }
-            )
-            fig = px.scatter(
-                dataframe,
-                x="Leverage",
-                y="Standardized Residuals",
-                trendline="lowess",
-                title="Residuals vs Leverage",
-                opacity=0.3,
-            )
-
-        maxmo = max(model_leverage) * 1.05
-        fig.update_xaxes(range=[0, maxmo])
-        min_r = min(standardized_residuals)
-        max_r = max(standardized_residuals)
-        fig.update_yaxes(range=[min_r - 0.05 * abs(min_r), max_r + 0.05 * abs(max_r)])
-        leverage_top_3 = cooks_distances.sort_values(ascending=False)[:3]
-        for i in leverage_top_3.index:
-            fig.add_annotation(
-                x=model_leverage[i],
-                y=standardized_residuals[i],
-                text=f"$\\tilde r_{{{i}}}$",
-            )
-
-        fig.update_annotations(
-            dict(xref="x", yref="y", showarrow=True, arrowhead=7, ax=0, ay=-40)
+        max_leverage = np.max(model_leverage)
+        maxmo = max_leverage * 1.05
+        min_r = np.min(standardized_residuals)
+        max_r = np.max(standardized_residuals)
+        leverage_top_3 = cooks_distances.nlargest(3)
+        fig.update_layout(
+            xaxis_range=[0, maxmo],
+            yaxis_range=[min_r - 0.05 * abs(min_r), max_r + 0.05 * abs(max_r)],
+            annotations=[
+                dict(
+                    x=model_leverage[i],
+                    y=standardized_residuals[i],
+                    text=f"$\\tilde r_{{{i}}}$",
+                    **ANNOTATION_STYLE,
+                )
+                for i in leverage_top_3.index
+            ],
         )
 
         def graph(formula, x_range, label, c, text):
@@ -399,47 +455,39 @@ class CooksDistanceWidget(BaseFigureWidget):
             text_list[x_range.shape[0] // 4] = text
             text_list[(x_range.shape[0] // 4) * 3] = text
 
-            fig.add_trace(
-                go.Scatter(
-                    x=x,
-                    y=y,
-                    name=label,
-                    line=dict(color=c, width=2, dash="dash"),
-                    mode="lines+text",
-                    textposition="bottom center",
-                    showlegend=False,
-                    text=text_list,
-                )
-            )
-
-            fig.add_trace(
-                go.Scatter(
-                    x=x,
-                    y=-y,
-                    name=label,
-                    line=dict(color=c, width=2, dash="dash"),
-                    mode="lines+text",
-                    textposition="top center",
-                    showlegend=False,
-                    text=text_list,
-                )
+            # draw the upper and the mirrored lower contour as a single trace,
+            # the None entry separates both line segments
+            return go.Scatter(
+                x=np.concatenate((x, [None], x)),
+                y=np.concatenate((y, [None], -y)),
+                name=label,
+                line=dict(color=c, width=2, dash="dash"),
+                mode="lines+text",
+                textposition=["bottom center"] * (x.shape[0] + 1)
+                + ["top center"] * x.shape[0],
+                showlegend=False,
+                text=text_list + [""] + text_list,
             )
 
         p = n_model_params
-        graph(
-            lambda x: np.sqrt(np.abs((0.5 * (p + 1) * (1 - x)) / x)),
-            np.linspace(0.001, max(model_leverage), 50),
-            "Cook's distance = 0.5",
-            "coral",
-            "0.5",
-        )
-
-        graph(
-            lambda x: np.sqrt(np.abs((1 * (p + 1) * (1 - x)) / x)),
-            np.linspace(0.001, max(model_leverage), 50),
-            "Cook's distance = 1",
-            "firebrick",
-            "1",
+        leverage_range = np.linspace(0.001, max_leverage, 50)
+        fig.add_traces(
+            [
+                graph(
+                    lambda x: np.sqrt(np.abs((0.5 * (p + 1) * (1 - x)) / x)),
+                    leverage_range,
+                    "Cook's distance = 0.5",
+                    "coral",
+                    "0.5",
+                ),
+                graph(
+                    lambda x: np.sqrt(np.abs((1 * (p + 1) * (1 - x)) / x)),
+                    leverage_range,
+                    "Cook's distance = 1",
+                    "firebrick",
+                    "1",
+                ),
+            ]
         )
         return fig
 
@@ -476,9 +524,12 @@ class CooksDistanceWidget(BaseFigureWidget):
             standardized_residuals,
             n_model_params,
             split_origin=split_origin,
+            render_mode=self._render_mode,
         )
-        self.update({"data": self._plot.data}, overwrite=True)
-        self.update_layout()
+        with self.batch_update():
+            self.update(
+                {"data": self._plot.data, "layout": self._plot.layout}, overwrite=True
+            )
 
 
 class TukeyAnscombeWidget(BaseFigureWidget):
@@ -494,6 +545,7 @@ class TukeyAnscombeWidget(BaseFigureWidget):
         predictions: np.ndarray,
         residuals: np.ndarray,
         split_origin: np.ndarray = None,
+        render_mode: str = "auto",
         **kwargs,
     ):
         """
@@ -510,55 +562,41 @@ class TukeyAnscombeWidget(BaseFigureWidget):
             These residuals can be marked explicitly in the plot. To do this attribute must have the same dimensionality
             as the predictions and residuals array. Each entry in this array must be one of the strings ['train', 'test']
             to denote from which split this observation originates.
+        render_mode: str
+            One of ['auto', 'svg', 'webgl']. With 'auto', WebGL is used once the plot contains more than
+            WEBGL_MIN_POINTS points, 'svg' can be used to force vector output.
         """
-
-        self._plot = self.__tukey_anscombe_plot(predictions, residuals, split_origin)
+        _check_render_mode(render_mode)
+        self._render_mode = render_mode
+        self._plot = self.__tukey_anscombe_plot(
+            predictions, residuals, split_origin, render_mode
+        )
         super(TukeyAnscombeWidget, self).__init__(self._plot, **kwargs)
 
     @staticmethod
-    def __tukey_anscombe_plot(predictions, residuals, split_origin):
-        if split_origin is not None:
-            dataframe = pd.DataFrame(
-                {
-                    "Predictions": predictions,
-                    "Residuals": residuals,
-                    "Split": split_origin,
-                }
-            )
-
-            fig = px.scatter(
-                dataframe,
-                x="Predictions",
-                y="Residuals",
-                trendline="lowess",
-                color="Split",
-                color_discrete_sequence=["blue", "green"],
-                title="Tukey-Anscombe Plot",
-                opacity=0.3,
-            )
-
-            fig.update_layout(showlegend=False)
-        else:
-            dataframe = pd.DataFrame(
-                {"Predictions": predictions, "Residuals": residuals}
-            )
-
-            fig = px.scatter(
-                dataframe,
-                x="Predictions",
-                y="Residuals",
-                trendline="lowess",
-                title="Tukey-Anscombe Plot",
-                opacity=0.3,
-            )
+    def __tukey_anscombe_plot(predictions, residuals, split_origin, render_mode="auto"):
+        fig = _lowess_scatter(
+            "Predictions",
+            predictions,
+            "Residuals",
+            residuals,
+            title="Tukey-Anscombe Plot",
+            split_origin=split_origin,
+            render_mode=render_mode,
+        )
 
         model_abs_resid = pd.Series(np.abs(residuals))
-        abs_resid = model_abs_resid.sort_values(ascending=False)
-        abs_resid_top_3 = abs_resid[:3]
-        for i in abs_resid_top_3.index:
-            fig.add_annotation(x=predictions[i], y=residuals[i], text=f"$r_{{{i}}}$")
-        fig.update_annotations(
-            dict(xref="x", yref="y", showarrow=True, arrowhead=7, ax=0, ay=-40)
+        abs_resid_top_3 = model_abs_resid.nlargest(3)
+        fig.update_layout(
+            annotations=[
+                dict(
+                    x=predictions[i],
+                    y=residuals[i],
+                    text=f"$r_{{{i}}}$",
+                    **ANNOTATION_STYLE,
+                )
+                for i in abs_resid_top_3.index
+            ]
         )
         return fig
 
@@ -583,9 +621,13 @@ class TukeyAnscombeWidget(BaseFigureWidget):
             as the predictions and residuals array. Each entry in this array must be one of the strings ['train', 'test']
             to denote from which split this observation originates.
         """
-        self._plot = self.__tukey_anscombe_plot(predictions, residuals, split_origin)
-        self.update({"data": self._plot.data}, overwrite=True)
-        self.update_layout()
+        self._plot = self.__tukey_anscombe_plot(
+            predictions, residuals, split_origin, self._render_mode
+        )
+        with self.batch_update():
+            self.update(
+                {"data": self._plot.data, "layout": self._plot.layout}, overwrite=True
+            )
 
 
 class InteractiveResidualsPlot:
@@ -611,6 +653,8 @@ class InteractiveResidualsPlot:
         y: np.ndarray,
         x_test: np.ndarray = None,
         y_test: np.ndarray = None,
+        render_mode: str = "auto",
+        max_points: Optional[int] = 5000,
     ):
         """
         Instantiates the interactive residual plots for the given data
@@ -629,10 +673,18 @@ class InteractiveResidualsPlot:
             optional, some test data (requires y_test)
         y_test: np.ndarray
             optional, the labels to the provided test data (requires x_test)
+        render_mode: str
+            One of ['auto', 'svg', 'webgl'], passed on to all four plots. Use 'svg' to force vector output.
+        max_points: int
+            Optional, the maximum number of quantiles drawn in the QQ plot. If None, all quantiles are drawn.
         """
 
+        _check_render_mode(render_mode)
+        _check_max_points(max_points)
         self.figures: [BaseFigureWidget] = []
         self.display: Display = display
+        self.render_mode = render_mode
+        self.max_points = max_points
         self.plot = self.__create_resplots(model, x, y, x_test, y_test)
 
     def show(self):
@@ -684,11 +736,13 @@ class InteractiveResidualsPlot:
 
         with fit_if_not_fitted(model, x, y) as fitted_model:
             fitted = fitted_model.predict(x)
-            fitted_residuals = fitted - y
+            # work on plain arrays from here on, so plotly gets numpy buffers instead of
+            # pandas objects and positional lookups do not depend on the index of y
+            fitted_residuals = fitted - np.asarray(y)
 
             if x_test is not None and y_test is not None:
                 pred = fitted_model.predict(x_test)
-                prediction_residuals = pred - y_test
+                prediction_residuals = pred - np.asarray(y_test)
 
                 predictions = np.concatenate((fitted, pred))
                 residuals = np.concatenate((fitted_residuals, prediction_residuals))
@@ -706,19 +760,28 @@ class InteractiveResidualsPlot:
                 predictions = fitted
                 residuals = fitted_residuals
                 split_origin = None
+                y = np.asarray(y)
 
         logger.info("Calculated model residuals")
         self.display.move_progress()
 
         tukey_anscombe_widget = TukeyAnscombeWidget(
-            predictions, residuals, split_origin=split_origin
+            predictions,
+            residuals,
+            split_origin=split_origin,
+            render_mode=self.render_mode,
         )
         logger.info("Calculated Tunkey-Anscombe Plot")
         self.figures.append(tukey_anscombe_widget)
         self.display.move_progress()
 
         qq_plot_widget = QQPlotWidget(
-            predictions, y, split_origin=split_origin, featuresize=x.shape[1]
+            predictions,
+            y,
+            split_origin=split_origin,
+            featuresize=x.shape[1],
+            render_mode=self.render_mode,
+            max_points=self.max_points,
         )
         logger.info("Calculated Normal QQ Plot")
         self.figures.append(qq_plot_widget)
@@ -729,7 +792,10 @@ class InteractiveResidualsPlot:
         )
         model_norm_residuals_abs_sqrt = np.sqrt(np.abs(standardized_residuals))
         scale_location_widget = ScaleLocationWidget(
-            predictions, model_norm_residuals_abs_sqrt, split_origin=split_origin
+            predictions,
+            model_norm_residuals_abs_sqrt,
+            split_origin=split_origin,
+            render_mode=self.render_mode,
         )
         logger.info("Calculated Scale-Location Plot")
         self.figures.append(scale_location_widget)
@@ -747,6 +813,7 @@ class InteractiveResidualsPlot:
             standardized_residuals,
             n_model_params,
             split_origin=split_origin,
+            render_mode=self.render_mode,
         )
         logger.info("Calculated Residual vs Leverage Plot inc. Cook's distance")
         self.figures.append(cooks_distance_widget)
@@ -0,0 +1,170 @@
+import os, sys
+
+sys.path.insert(0, os.path.abspath(".."))
+
+import numpy as np
+import pandas as pd
+import pytest
+import sklearn.linear_model
+import pycaret.internal.plots.helper as helper
+from pycaret.internal.Display import Display
+from pycaret.internal.plots.residual_plots import (
+    CooksDistanceWidget,
+    InteractiveResidualsPlot,
+    QQPlotWidget,
+    TukeyAnscombeWidget,
+)
+
+
+def test_qq_plot_render_mode():
+    rng = np.random.default_rng(123)
+
+    # auto switches to WebGL above 1000 points, like plotly.express
+    qq_plot = QQPlotWidget(rng.normal(size=1000))
+    assert qq_plot.data[0].type == "scatter"
+    qq_plot = QQPlotWidget(rng.normal(size=1001))
+    assert qq_plot.data[0].type == "scattergl"
+
+    # forced modes ignore the number of points
+    qq_plot = QQPlotWidget(rng.normal(size=1001), render_mode="svg")
+    assert qq_plot.data[0].type == "scatter"
+    qq_plot = QQPlotWidget(rng.normal(size=10), render_mode="webgl")
+    assert qq_plot.data[0].type == "scattergl"
+
+    predictions = rng.normal(size=2000)
+    tukey_anscombe = TukeyAnscombeWidget(
+        predictions, rng.normal(size=2000), render_mode="svg"
+    )
+    assert {trace.type for trace in tukey_anscombe.data} == {"scatter"}
+
+    for render_mode in ["SVG", "gl"]:
+        with pytest.raises(ValueError):
+            QQPlotWidget(rng.normal(size=10), render_mode=render_mode)
+        with pytest.raises(ValueError):
+            TukeyAnscombeWidget(predictions, predictions, render_mode=render_mode)
+
+
+def test_update_values_refreshes_layout():
+    rng = np.random.default_rng(123)
+    leverage = rng.uniform(0.001, 0.1, size=200)
+    standardized_residuals = rng.normal(size=200)
+    cooks_distances = rng.uniform(size=200)
+
+    cooks_distance = CooksDistanceWidget(
+        leverage, cooks_distances, standardized_residuals, 5
+    )
+    first_x_range = cooks_distance.layout.xaxis.range
+
+    cooks_distances[7] = 100
+    cooks_distance.update_values(
+        leverage * 2, cooks_distances, standardized_residuals * 3, 5
+    )
+    assert cooks_distance.layout.xaxis.range[1] == pytest.approx(2 * first_x_range[1])
+    assert cooks_distance.layout.yaxis.range[1] == pytest.approx(
+        1.05 * np.max(standardized_residuals * 3)
+    )
+    assert cooks_distance.layout.annotations[0].text == "$\\tilde r_{7}$"
+    assert cooks_distance.layout.title.text == "Residuals vs Leverage"
+
+
+def test_qq_plot_max_points():
+    rng = np.random.default_rng(123)
+    residuals = rng.normal(size=20000)
+    split_origin = np.where(residuals > 0, "test", "train")
+
+    qq_plot = QQPlotWidget(residuals, split_origin=split_origin)
+    quantiles = qq_plot.data[0]
+    assert len(quantiles.x) == 5000
+    assert quantiles.y[0] == residuals.min()
+    assert quantiles.y[-1] == residuals.max()
+    # the thinned out split labels still belong to their quantiles
+    assert (quantiles.customdata == np.where(quantiles.y > 0, "test", "train")).all()
+    # the OLS line spans the full range of theoretical quantiles
+    assert tuple(qq_plot.data[1].x) == (quantiles.x[0], quantiles.x[-1])
+
+    qq_plot = QQPlotWidget(residuals, split_origin=split_origin, max_points=None)
+    assert len(qq_plot.data[0].x) == 20000
+
+    for max_points in [0, 1]:
+        with pytest.raises(ValueError):
+            QQPlotWidget(residuals, max_points=max_points)
+
+    # the cap can be lifted for the complete set of residual plots
+    x = pd.DataFrame(rng.normal(size=(6000, 3)))
+    y = pd.Series(x.sum(axis=1) + rng.normal(size=6000))
+    resplots = InteractiveResidualsPlot(
+        Display(verbose=False),
+        sklearn.linear_model.LinearRegression(),
+        x,
+        y,
+        max_points=None,
+    )
+    assert len(resplots.figures[1].data[0].x) == 6000
+
+
+def test_interactive_residuals_plot_with_shuffled_index():
+    # targets of a train/test split keep a shuffled, non-positional index
+    rng = np.random.default_rng(123)
+    index = rng.permutation(300)
+    x = pd.DataFrame(rng.normal(size=(300, 3)), index=index)
+    y = pd.Series(x.sum(axis=1) + rng.normal(size=300), index=index)
+    x_train, x_test, y_train, y_test = x[:200], x[200:], y[:200], y[200:]
+
+    for kwargs in [{}, {"x_test": x_test, "y_test": y_test}]:
+        resplots = InteractiveResidualsPlot(
+            Display(verbose=False),
+            sklearn.linear_model.LinearRegression(),
+            x_train,
+            y_train,
+            **kwargs,
+        )
+        assert len(resplots.figures) == 4
+        tukey_anscombe = resplots.figures[0]
+        for annotation in tukey_anscombe.layout.annotations:
+            assert annotation.text.startswith("$r_")
+
+
+def test_leverage_statistic():
+    rng = np.random.default_rng(123)
+    for x in [rng.normal(size=(200, 4)), rng.normal(size=200)]:
+        x_2d = x.reshape(x.shape[0], -1)
+        hat_matrix = x_2d.dot(np.linalg.inv(x_2d.T.dot(x_2d))).dot(x_2d.T)
+        assert np.allclose(helper.leverage_statistic(x), hat_matrix.diagonal())
+
+
+def test_standardized_residuals_and_cooks_distance():
+    rng = np.random.default_rng(123)
+    expected = rng.normal(size=200)
+    predicted = expected + rng.normal(size=200)
+    n, m, p = 200, 3, 5
+
+    standardized_residuals = helper.calculate_standardized_residual(
+        predicted, expected, featuresize=m
+    )
+    residuals = expected - predicted
+    s2_hat = 1 / (n - m) * np.sum(residuals**2)
+    leverage = 1 / n + (expected - np.mean(expected)) / np.sum(
+        (expected - np.mean(expected)) ** 2
+    )
+    assert np.allclose(
+        standardized_residuals, residuals / (np.sqrt(s2_hat) * (1 - leverage))
+    )
+
+    leverage = rng.uniform(0.001, 0.5, size=200)
+    distance = helper.cooks_distance(
+        standardized_residuals, list(leverage), n_model_params=p
+    )
+    multiplier = [element / (1 - element) for element in leverage]
+    assert np.allclose(
+        distance,
+        np.multiply(np.power(standardized_residuals, 2) / (p + 1), multiplier),
+    )
+
+
+if __name__ == "__main__":
+    test_qq_plot_render_mode()
+    test_update_values_refreshes_layout()
+    test_qq_plot_max_points()
+    test_interactive_residuals_plot_with_shuffled_index()
+    test_leverage_statistic()
+    test_standardized_residuals_and_cooks_distance()